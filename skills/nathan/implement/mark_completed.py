@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Mark plan complete: add timestamp to frontmatter and move to completed folder."""
-import sys, re
+import os, sys, re, tempfile
 from datetime import datetime
 from pathlib import Path
 
+_FIELD_RE = re.compile(r"^(modified|completed):.*$", re.M)
+
 def mark_completed(filepath: str) -> None:
     path = Path(filepath)
     content = path.read_text()
@@ -13,12 +15,14 @@ def mark_completed(filepath: str) -> None:
         # Update existing frontmatter - add completed field
         end = content.index("---", 3)
         fm = content[4:end]
-        # Update modified and add completed
-        fm = re.sub(r"modified:.*", f"modified: {now}", fm)
-        if "completed:" not in fm:
+        # Update modified and completed in one pass, adding completed if missing
+        fields = set()
+        def stamp(m):
+            fields.add(m.group(1))
+            return f"{m.group(1)}: {now}"
+        fm = _FIELD_RE.sub(stamp, fm)
+        if "completed" not in fields:
             fm = fm.rstrip() + f"\ncompleted: {now}\n"
-        else:
-            fm = re.sub(r"completed:.*", f"completed: {now}", fm)
         content = f"---\n{fm}---{content[end+3:]}"
     else:
         # Add new frontmatter with completed
@@ -29,7 +33,18 @@ def mark_completed(filepath: str) -> None:
     completed_dir = path.parent / "completed"
     completed_dir.mkdir(exist_ok=True)
     new_path = completed_dir / path.name
-    new_path.write_text(content)
+    # Write to a temp file and rename so new_path is never left half-written
+    tmp = tempfile.NamedTemporaryFile("w", dir=completed_dir, delete=False)
+    try:
+        with tmp:
+            tmp.write(content)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.chmod(tmp.name, path.stat().st_mode & 0o777)  # temp files are created 0600
+        os.replace(tmp.name, new_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
     path.unlink()
     print(f"Moved to {new_path}")
 
@@ -19,11 +19,13 @@ Run without arguments to see available commands.
 """
 
 import argparse
+import functools
 import json
+import os
 import shutil
 import subprocess
 import sys
-import tomllib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 
@@ -38,6 +40,19 @@ class Colors:
     RESET = '\033[0m'
 
 
+@functools.lru_cache(maxsize=16)
+def _load_toml_cached(path_str: str, mtime_ns: int) -> dict:
+    import tomllib  # lazy: only setup/export read TOML
+
+    with open(path_str, "rb") as f:
+        return tomllib.load(f)
+
+
+def load_toml(path: Path) -> dict:
+    """Parse a TOML file, reusing the previous parse if the file is unchanged"""
+    return _load_toml_cached(str(path.resolve()), path.stat().st_mtime_ns)
+
+
 # =============================================================================
 # SETUP command
 # =============================================================================
@@ -48,6 +63,8 @@ STARTER_SETTINGS = {
     }
 }
 
+_STARTER_SETTINGS_JSON = json.dumps(STARTER_SETTINGS, indent=2) + "\n"
+
 CLAUDE_MD_TEMPLATE = '''# {name}
 
 {description}
@@ -94,12 +111,35 @@ def setup_claude_symlinks(workspace_path: Path):
 
     settings_file = workspace_claude / "settings.local.json"
     if not settings_file.exists():
-        with open(settings_file, "w") as f:
-            json.dump(STARTER_SETTINGS, f, indent=2)
-            f.write("\n")
+        settings_file.write_text(_STARTER_SETTINGS_JSON)
         print(f"  ✓ Created settings.local.json with starter permissions")
 
 
+def clone_repo(path: Path, remote: str, target_path: Path, full: bool = False,
+               jobs: int | None = None) -> tuple[Path, bool, str]:
+    """Clone a remote into target_path. Returns (path, success, message)
+
+    Unless full is set, this is a partial clone (--filter=blob:none): blobs are
+    fetched on demand, which needs a server supporting protocol v2 filters
+    (GitHub and GitLab do). Submodules are cloned too; jobs sets how many are
+    fetched at once, otherwise git's submodule.fetchJobs applies. Clones already
+    run concurrently, so this is left unset by default to avoid flooding the host.
+    """
+    clone_args = ["git", "clone", "--recurse-submodules"]
+    if jobs:
+        clone_args.append(f"-j{jobs}")
+    if not full:
+        clone_args.append("--filter=blob:none")
+    try:
+        subprocess.run(
+            [*clone_args, remote, str(target_path)],
+            check=True, capture_output=True
+        )
+        return path, True, f"✓ Cloned {remote} -> {path}"
+    except subprocess.CalledProcessError as e:
+        return path, False, f"✗ Failed to clone {remote}: {e.stderr.decode()}"
+
+
 def cmd_setup(args):
     """Setup repos for a workspace based on workspace.toml"""
     workspace_path = Path(args.workspace)
@@ -113,8 +153,7 @@ def cmd_setup(args):
         print(f"Error: workspace.toml not found in {args.workspace}")
         sys.exit(1)
 
-    with open(workspace_toml, "rb") as f:
-        config = tomllib.load(f)
+    config = load_toml(workspace_toml)
 
     if "repos" not in config:
         print("Error: No 'repos' section found in workspace.toml")
@@ -155,6 +194,7 @@ def cmd_setup(args):
     setup_claude_symlinks(workspace_path)
 
     print("\nSetting up repositories...")
+    clones = []
     for repo in config["repos"]:
         path = Path(repo["path"])
         target_path = workspace_path / path
@@ -173,18 +213,20 @@ def cmd_setup(args):
             continue
 
         if remote := repo.get("remote"):
-            try:
-                subprocess.run(
-                    ["git", "clone", remote, str(target_path)],
-                    check=True, capture_output=True
-                )
-                print(f"✓ Cloned {remote} -> {path}")
-            except subprocess.CalledProcessError as e:
-                print(f"✗ Failed to clone {remote}: {e.stderr.decode()}")
+            clones.append((path, remote, target_path))
             continue
 
         print(f"⊘ {path} has no remote or source, skipping")
 
+    # Clones are network-bound, so run them concurrently
+    if clones:
+        max_workers = max(2, (os.cpu_count() or 4) * 3 // 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(clone_repo, *clone, args.full, args.jobs) for clone in clones]
+            for future in as_completed(futures):
+                _, _, message = future.result()
+                print(message)
+
     print(f"\nWorkspace '{args.workspace}' is ready!")
 
 
@@ -192,17 +234,71 @@ def cmd_setup(args):
 # CHECK command
 # =============================================================================
 
-def run_git(repo_path: Path, *args) -> tuple[bool, str]:
-    """Run a git command and return (success, output)"""
+def run_git(repo_path: Path, *args, max_lines: int | None = None) -> tuple[bool, str]:
+    """Run a git command and return (success, output)
+
+    With max_lines, output is streamed and git is stopped once that many
+    lines have been read, so long logs are never held in memory.
+    """
     try:
-        result = subprocess.run(
-            ["git", *args], cwd=repo_path, capture_output=True, text=True
-        )
-        return True, result.stdout.strip()
+        if max_lines is None:
+            result = subprocess.run(
+                ["git", *args], cwd=repo_path, capture_output=True, text=True
+            )
+            return True, result.stdout.strip()
+
+        with subprocess.Popen(
+            ["git", *args], cwd=repo_path, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True
+        ) as proc:
+            lines = []
+            for line in proc.stdout:
+                lines.append(line)
+                if len(lines) >= max_lines:
+                    break
+            proc.stdout.close()
+            proc.terminate()
+        return True, "".join(lines).strip()
     except Exception as e:
         return False, str(e)
 
 
+MAX_LOG_LINES = 50
+
+
+def _commit_list(lines: list[str], count: int) -> str:
+    """Join up to MAX_LOG_LINES commit lines, noting any of the count that aren't shown"""
+    shown = lines[:MAX_LOG_LINES]
+    text = "\n".join(shown)
+    if count > len(shown):
+        more = f"... and {count - len(shown)} more"
+        text = f"{text}\n{more}" if text else more
+    return text
+
+
+def parse_status_v2(output: str) -> tuple[str, int, int]:
+    """Parse `git status --porcelain=v2 --branch` into (short-format changes, ahead, behind)"""
+    changes = []
+    ahead, behind = 0, 0
+    for line in output.split("\n"):
+        if line.startswith("# branch.ab "):
+            _, _, a, b = line.split(" ")
+            ahead, behind = int(a[1:]), int(b[1:])
+        elif line.startswith(("1 ", "2 ", "u ")):
+            # Ordinary, renamed/copied and unmerged entries have 8, 9 and 10 fields before the path
+            maxsplit = {"1": 8, "2": 9, "u": 10}[line[0]]
+            fields = line.split(" ", maxsplit)
+            xy = fields[1].replace(".", " ")
+            path = fields[-1]
+            if "\t" in path:
+                path, orig_path = path.split("\t", 1)
+                path = f"{orig_path} -> {path}"
+            changes.append(f"{xy} {path}")
+        elif line.startswith(("? ", "! ")):
+            changes.append(f"{line[0] * 2} {line[2:]}")
+    return "\n".join(changes), ahead, behind
+
+
 def check_repo(repo_path: Path, fetch: bool = False) -> dict:
     """Check a git repo for uncommitted/unpushed changes"""
     result = {"is_git_repo": False, "uncommitted": "", "outgoing": "", "incoming": ""}
@@ -212,20 +308,32 @@ def check_repo(repo_path: Path, fetch: bool = False) -> dict:
 
     result["is_git_repo"] = True
 
-    success, output = run_git(repo_path, "status", "--porcelain")
-    if success:
-        result["uncommitted"] = output
-
     if fetch:
         run_git(repo_path, "fetch", "--quiet")
 
-    success, output = run_git(repo_path, "log", "@{u}..", "--oneline")
-    if success:
-        result["outgoing"] = output
-
-    success, output = run_git(repo_path, "log", "..@{u}", "--oneline")
-    if success:
-        result["incoming"] = output
+    # One status call reports both working tree changes and ahead/behind counts
+    success, output = run_git(repo_path, "status", "--porcelain=v2", "--branch")
+    if not success:
+        return result
+    result["uncommitted"], ahead, behind = parse_status_v2(output)
+
+    if 0 < ahead + behind <= 2 * MAX_LOG_LINES:
+        # One symmetric-difference log covers both sides: '<' is outgoing, '>' incoming
+        success, output = run_git(repo_path, "log", "--left-right", "--oneline", "HEAD...@{u}")
+        if success:
+            outgoing = [line[2:] for line in output.split("\n") if line.startswith("<")]
+            incoming = [line[2:] for line in output.split("\n") if line.startswith(">")]
+            result["outgoing"] = _commit_list(outgoing, ahead)
+            result["incoming"] = _commit_list(incoming, behind)
+    else:
+        # Too many to read in one go: the combined log is in date order, so a
+        # shared cap could crowd out one side entirely. Cap each side instead.
+        for key, count, revs in (("outgoing", ahead, "@{u}.."), ("incoming", behind, "..@{u}")):
+            if count:
+                success, output = run_git(repo_path, "log", revs, "--oneline", f"-n{MAX_LOG_LINES}",
+                                          max_lines=MAX_LOG_LINES)
+                if success:
+                    result[key] = _commit_list(output.split("\n"), count)
 
     return result
 
@@ -242,11 +350,15 @@ def check_workspace(workspace_path: Path, fetch: bool = False) -> tuple[int, int
 
     clean, dirty = 0, 0
 
-    for repo in sorted(repos_path.iterdir()):
-        if not repo.is_dir():
-            continue
+    # git calls are I/O-bound, so check repos concurrently; print serially in sorted order
+    # DirEntry caches file type from readdir, saving a stat per plain directory
+    with os.scandir(repos_path) as it:
+        repos = [Path(entry.path) for entry in sorted(it, key=lambda e: e.name) if entry.is_dir()]
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        statuses = list(pool.map(lambda repo: check_repo(repo, fetch), repos))
 
-        status = check_repo(repo, fetch)
+    for repo, status in zip(repos, statuses):
         if not status["is_git_repo"]:
             continue
 
@@ -280,9 +392,12 @@ def check_workspace(workspace_path: Path, fetch: bool = False) -> tuple[int, int
 def find_workspaces(base_path: Path) -> list[Path]:
     """Find all workspace directories (those with repos/ folder)"""
     workspaces = []
-    for item in base_path.iterdir():
-        if item.is_dir() and not item.name.startswith(".") and (item / "repos").is_dir():
-            workspaces.append(item)
+    with os.scandir(base_path) as it:
+        for entry in it:
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            if os.path.isdir(os.path.join(entry.path, "repos")):
+                workspaces.append(Path(entry.path))
     return sorted(workspaces)
 
 
@@ -329,6 +444,39 @@ def cmd_check(args):
 # LINK command
 # =============================================================================
 
+def read_workspace_field(path: Path) -> str | None:
+    """Return the workspace named in a note's frontmatter, or None
+
+    Only the frontmatter block is read, so large notes cost a few lines.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.readline().strip() != "---":
+                return None
+            for line in f:
+                if line.strip() == "---":
+                    return None
+                if line.startswith("workspace: "):
+                    return line.split(":", 1)[1].strip()
+    except (OSError, UnicodeDecodeError):
+        pass
+    return None
+
+
+def iter_notes_with_workspace(vault: Path):
+    """Yield (note, workspace) for every markdown note in the vault with workspace frontmatter"""
+    notes = []
+    for root, _, files in os.walk(vault):
+        notes.extend(Path(root) / name for name in files if name.endswith(".md"))
+    notes.sort()
+
+    # Reading frontmatter is I/O-bound; vaults can hold thousands of notes
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        for note, workspace in zip(notes, pool.map(read_workspace_field, notes)):
+            if workspace:
+                yield note, workspace
+
+
 def cmd_link(args):
     """Link Obsidian notes with workspace frontmatter to their workspaces"""
     vault = Path("../Notes/notes").expanduser()
@@ -343,28 +491,16 @@ def cmd_link(args):
     if (Path.home() / "Dropbox/Apps").exists():
         aibrief_dir.mkdir(parents=True, exist_ok=True)
 
-    # Find all notes with workspace frontmatter
-    try:
-        result = subprocess.run(
-            ["grep", "-rl", "^workspace: ", str(vault)],
-            capture_output=True, text=True
-        )
-        notes = [Path(p) for p in result.stdout.strip().split("\n") if p]
-    except Exception as e:
-        print(f"{Colors.RED}Error searching vault: {e}{Colors.RESET}")
-        sys.exit(1)
+    # Hard links fail across filesystems; check once instead of failing per note
+    aibrief_dev = aibrief_dir.stat().st_dev if aibrief_dir.is_dir() else None
+    can_hardlink = aibrief_dev is not None and aibrief_dev == vault.stat().st_dev
 
-    for note in notes:
-        # Extract workspace name from frontmatter
-        workspace = None
-        with open(note) as f:
-            for line in f:
-                if line.startswith("workspace: "):
-                    workspace = line.split("workspace: ")[1].strip()
-                    break
+    # One directory listing instead of a stat per note
+    with os.scandir(workspaces_dir) as it:
+        known_workspaces = {entry.name for entry in it if entry.is_dir()}
 
-        if not workspace:
-            continue
+    for note, workspace in iter_notes_with_workspace(vault):
+        resolved = note.resolve()
 
         # Determine workspace directory
         workspace_dir = workspaces_dir / workspace
@@ -372,25 +508,25 @@ def cmd_link(args):
         aibrief_link = aibrief_dir / f"{workspace}.md"
 
         # Link to workspace folder
-        if not workspace_dir.is_dir():
+        if workspace not in known_workspaces:
             print(f"- {workspace} (no workspace folder)")
         elif link_path.is_symlink():
             print(f"✓ {workspace} (already linked)")
         elif link_path.exists():
             print(f"✗ {workspace} (journal.md exists but is not a symlink)")
         else:
-            link_path.symlink_to(note.resolve())
+            link_path.symlink_to(resolved)
             print(f"✓ {workspace} → {note}")
 
         # Hard link to aibrief folder (symlinks don't work with Dropbox API)
-        if aibrief_dir.is_dir():
+        if can_hardlink:
             if aibrief_link.exists():
                 aibrief_link.unlink()
             try:
-                aibrief_link.hardlink_to(note.resolve())
+                aibrief_link.hardlink_to(resolved)
                 print(f"  + aibrief: {workspace}.md (hard linked)")
             except OSError:
-                # Hard links may fail across filesystems
+                # e.g. a note symlinked in from another filesystem
                 pass
 
 
@@ -398,6 +534,71 @@ def cmd_link(args):
 # EXPORT command
 # =============================================================================
 
+def _fast_copy(src, dst):
+    """Copy a file's contents and metadata, using in-kernel copies where available"""
+    if sys.version_info >= (3, 14):
+        # Path.copy tries FICLONE/copy_file_range itself
+        Path(src).copy(dst, preserve_metadata=True)
+        return dst
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        if remaining > 0:
+            shutil.copyfile(src, dst)
+    except (AttributeError, OSError):
+        # No copy_file_range (non-Linux) or unsupported across these filesystems
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _sync_tree(src_dir: Path, dest_dir: Path) -> list[tuple[Path, Path]]:
+    """Mirror src_dir's layout into dest_dir and list the (src, dst) files that need copying
+
+    Files whose size and mtime already match are skipped, and destination
+    entries that no longer exist in src_dir are removed.
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    with os.scandir(dest_dir) as it:
+        existing = {entry.name: entry for entry in it}
+
+    copies = []
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            dest_path = dest_dir / entry.name
+            dest = existing.pop(entry.name, None)
+            if dest is not None and dest.is_symlink():
+                dest_path.unlink()
+                dest = None
+
+            if entry.is_dir():
+                if dest is not None and not dest.is_dir():
+                    dest_path.unlink()
+                copies.extend(_sync_tree(Path(entry.path), dest_path))
+                continue
+
+            if dest is not None:
+                if dest.is_dir():
+                    shutil.rmtree(dest_path)
+                else:
+                    src_stat, dest_stat = entry.stat(), dest.stat()
+                    if (src_stat.st_size, src_stat.st_mtime_ns) == (dest_stat.st_size, dest_stat.st_mtime_ns):
+                        continue
+            copies.append((Path(entry.path), dest_path))
+
+    for entry in existing.values():
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+    return copies
+
+
 def cmd_export(args):
     """Export a workspace to an external location for sharing"""
     workspace_path = Path(args.workspace)
@@ -416,22 +617,25 @@ def cmd_export(args):
     export_path.mkdir(parents=True, exist_ok=True)
     print(f"Exporting to: {export_path}")
 
+    # Directories are synced up front; changed files are queued and copied in a pool
+    copies = []
+    messages = []
+
     # Copy workspace.py
     script_path = Path(__file__).resolve()
     dest_script = export_path / "workspace.py"
-    shutil.copy2(script_path, dest_script)
-    dest_script.chmod(0o755)
-    print(f"✓ Copied workspace.py")
+    copies.append((script_path, dest_script))
+    messages.append(f"✓ Copied workspace.py")
 
     # Copy root CLAUDE.md and README.md
     root_dir = Path(__file__).parent
     for filename in ["CLAUDE.md", "README.md"]:
         src = root_dir / filename
         if src.exists():
-            shutil.copy2(src, export_path / filename)
-            print(f"✓ Copied {filename}")
+            copies.append((src, export_path / filename))
+            messages.append(f"✓ Copied {filename}")
         else:
-            print(f"⊘ No root {filename} found")
+            messages.append(f"⊘ No root {filename} found")
 
     # Copy root .claude/agents and .claude/skills directories
     src_claude_dir = root_dir / ".claude"
@@ -441,37 +645,33 @@ def cmd_export(args):
         src_dir = src_claude_dir / subdir
         dest_dir = dest_claude_dir / subdir
         if src_dir.exists() and src_dir.is_dir():
-            if dest_dir.exists():
-                shutil.rmtree(dest_dir)
-            shutil.copytree(src_dir, dest_dir)
-            count = len(list(dest_dir.iterdir()))
-            print(f"✓ Copied .claude/{subdir}/ ({count} items)")
+            copies.extend(_sync_tree(src_dir, dest_dir))
+            count = len(list(src_dir.iterdir()))
+            messages.append(f"✓ Copied .claude/{subdir}/ ({count} items)")
         else:
             dest_dir.mkdir(exist_ok=True)
-            print(f"✓ Created .claude/{subdir}/ (empty)")
+            messages.append(f"✓ Created .claude/{subdir}/ (empty)")
 
     # Create workspace subdirectory
     ws_export = export_path / args.workspace
     ws_export.mkdir(exist_ok=True)
 
     # Copy workspace.toml
-    shutil.copy2(workspace_toml, ws_export / "workspace.toml")
-    print(f"✓ Copied {args.workspace}/workspace.toml")
+    copies.append((workspace_toml, ws_export / "workspace.toml"))
+    messages.append(f"✓ Copied {args.workspace}/workspace.toml")
 
     # Copy workspace CLAUDE.md if exists
     ws_claude = workspace_path / "CLAUDE.md"
     if ws_claude.exists():
-        shutil.copy2(ws_claude, ws_export / "CLAUDE.md")
-        print(f"✓ Copied {args.workspace}/CLAUDE.md")
+        copies.append((ws_claude, ws_export / "CLAUDE.md"))
+        messages.append(f"✓ Copied {args.workspace}/CLAUDE.md")
 
     # Copy plans/ directory if exists
     ws_plans = workspace_path / "plans"
     if ws_plans.exists() and ws_plans.is_dir():
         dest_plans = ws_export / "plans"
-        if dest_plans.exists():
-            shutil.rmtree(dest_plans)
-        shutil.copytree(ws_plans, dest_plans)
-        print(f"✓ Copied {args.workspace}/plans/")
+        copies.extend(_sync_tree(ws_plans, dest_plans))
+        messages.append(f"✓ Copied {args.workspace}/plans/")
 
     # Copy workspace .claude/agents and .claude/skills (skip symlinks like 'core')
     ws_claude = workspace_path / ".claude"
@@ -488,18 +688,24 @@ def cmd_export(args):
                     if not item.is_symlink():  # Skip 'core' symlinks
                         dest_item = dest_dir / item.name
                         if item.is_dir():
-                            if dest_item.exists():
-                                shutil.rmtree(dest_item)
-                            shutil.copytree(item, dest_item)
+                            copies.extend(_sync_tree(item, dest_item))
                         else:
-                            shutil.copy2(item, dest_item)
+                            copies.append((item, dest_item))
                         copied += 1
                 if copied:
-                    print(f"✓ Copied {copied} items from {args.workspace}/.claude/{subdir}/")
+                    messages.append(f"✓ Copied {copied} items from {args.workspace}/.claude/{subdir}/")
+
+    # Copies are small and I/O-bound, so run them concurrently
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for future in [pool.submit(_fast_copy, src, dst) for src, dst in copies]:
+            future.result()
+    dest_script.chmod(0o755)
+
+    for message in messages:
+        print(message)
 
     # Note about source entries
-    with open(workspace_toml, "rb") as f:
-        config = tomllib.load(f)
+    config = load_toml(workspace_toml)
 
     source_entries = [r for r in config.get("repos", []) if r.get("source")]
     if source_entries:
@@ -529,6 +735,7 @@ def main():
 
 {Colors.BOLD}Examples:{Colors.RESET}
   ./workspace.py setup webdev              # Setup the webdev workspace
+  ./workspace.py setup webdev --full       # Setup with full (non-partial) clones
   ./workspace.py gitcheck                  # Check all workspaces for changes
   ./workspace.py gitcheck refgenie         # Check specific workspace
   ./workspace.py gitcheck -f               # Fetch from remotes first
@@ -542,6 +749,10 @@ def main():
     # setup command
     setup_parser = subparsers.add_parser("setup", help="Setup a workspace")
     setup_parser.add_argument("workspace", help="Workspace directory name")
+    setup_parser.add_argument("--full", action="store_true",
+                              help="Fetch all blobs up front instead of a partial (blob:none) clone")
+    setup_parser.add_argument("-j", "--jobs", type=int,
+                              help="Parallel submodule fetches per clone (default: git's submodule.fetchJobs)")
 
     # gitcheck command
     check_parser = subparsers.add_parser("gitcheck", help="Check for git changes")